@@ -3,7 +3,7 @@ import sentencepiece  # Make sure sentencepiece is installed
 import pandas as pd
 import numpy as np
 from model.black_scholes import BlackScholes
-from visualization import GreeksVisualizations, PLVisualizations, TimeVsPriceVisualizations, VolatilityVisualizations, HeatmapVisualization
+from visualization import GreeksVisualizations, PLVisualizations, TimeVsPriceVisualizations, VolatilityVisualizations, HeatmapVisualization, HedgingVisualizations
 from model.llama_integration import LlamaIntegration  # Import the LlamaIntegration class
 
 def main():
@@ -20,6 +20,13 @@ def main():
     risk_free_rate = st.sidebar.number_input("Risk-free Interest Rate (r)", min_value=0.0, max_value=1.0, value=0.05)
     volatility = st.sidebar.number_input("Volatility (σ)", min_value=0.0, max_value=1.0, value=0.2)
 
+    # Sidebar for Delta Hedging Simulation
+    st.sidebar.header("Delta Hedging Simulation")
+    hedge_option_type = st.sidebar.selectbox("Hedged Option (short)", ["call", "put"])
+    realized_volatility = st.sidebar.number_input("Realized Volatility", min_value=0.01, max_value=1.0, value=max(volatility, 0.01))
+    n_paths = st.sidebar.number_input("Number of Paths", min_value=100, max_value=50000, value=10000, step=100)
+    rebalance_every = st.sidebar.number_input("Rebalance Every N Days", min_value=1, max_value=252, value=1)
+
     # Create Black-Scholes model instance
     option_model = BlackScholes(S0=spot_price, K=strike_price, T=time_to_maturity, r=risk_free_rate, sigma=volatility)
 
@@ -41,6 +48,14 @@ def main():
     visualizer_pl = PLVisualizations(option_model)
     visualizer_pl.plot_profit_loss()  # Display the plot for P&L vs Stock Price
 
+    # Delta-Hedged P&L Visualization
+    st.subheader("Delta-Hedged P&L Distribution")
+    visualizer_hedging = HedgingVisualizations(option_model)
+    visualizer_hedging.plot_hedging_pnl(
+        realized_sigma=realized_volatility, n_paths=int(n_paths), n_steps=max(1, round(252 * time_to_maturity)),  # One step per trading day
+        rebalance_every=int(rebalance_every), option_type=hedge_option_type
+    )  # Display the distribution of hedging P&L across simulated paths
+
     # Time vs Price Visualization
     st.subheader("Profit/Loss vs Time to Maturity (Call and Put)")
     visualizer_time_vs_price = TimeVsPriceVisualizations(option_model)
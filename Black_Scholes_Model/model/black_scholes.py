@@ -41,6 +41,16 @@ class BlackScholes:
         put_price = (self.K * np.exp(-self.r * self.T) * norm.cdf(-d2)) - (self.S0 * norm.cdf(-d1))
         return put_price
 
+    def calculate_call_delta(self):
+        """Calculate the delta of a European call option."""
+        d1 = self._calculate_d1()
+        return norm.cdf(d1)
+
+    def calculate_put_delta(self):
+        """Calculate the delta of a European put option."""
+        d1 = self._calculate_d1()
+        return norm.cdf(d1) - 1.0
+
 # Example of usage
 if __name__ == "__main__":
     # Initialize with parameters
@@ -0,0 +1,212 @@
+import numpy as np
+from scipy.stats import norm
+from model.black_scholes import BlackScholes
+
+class BlackScholesPricer:
+    def __init__(self, option_type="call"):
+        """
+        Batch pricer for European options using the closed-form Black-Scholes model.
+
+        Pricers used with BumpGreeks implement price(S, K, T, r, sigma), taking
+        arrays that broadcast against each other and returning an array of prices.
+
+        Parameters:
+        option_type : "call" or "put"
+        """
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'.")
+        self.option_type = option_type
+
+    def price(self, S, K, T, r, sigma):
+        """Price every scenario in the batch."""
+        option = BlackScholes(S, K, T, r, sigma)
+        return option.calculate_call_price() if self.option_type == "call" else option.calculate_put_price()
+
+class MonteCarloPricer:
+    def __init__(self, option_type="call", n_paths=100000, path_block=10000, chunk_size=1000000, seed=0):
+        """
+        Batch Monte Carlo pricer for European options under GBM.
+
+        Every call draws the same normal variates (from seed, in blocks of
+        path_block paths) and applies them to all scenarios in the batch, so
+        bumped scenarios are priced with common random numbers and finite
+        differences are not dominated by noise. The draws do not depend on the
+        batch, so a contract gets the same price alone or inside a larger batch.
+
+        Parameters:
+        option_type : "call" or "put"
+        n_paths     : Number of simulated terminal prices (even, made of antithetic pairs)
+        path_block  : Number of paths drawn at a time (even)
+        chunk_size  : Maximum number of simulated prices (options x paths) held per array batch;
+                      larger batches are split along the option axis
+        seed        : Seed for the random number generator
+        """
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'.")
+        if n_paths < 2 or n_paths % 2 or path_block < 2 or path_block % 2:
+            raise ValueError("n_paths and path_block must be positive and even (antithetic pairs).")
+        self.option_type = option_type
+        self.n_paths = n_paths
+        self.path_block = path_block
+        self.chunk_size = chunk_size
+        self.seed = seed
+
+    def price(self, S, K, T, r, sigma):
+        """Price every scenario in the batch."""
+        S, K, T, r, sigma = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (S, K, T, r, sigma)))
+        shape = S.shape
+        S, K, T, r, sigma = (a.ravel() for a in (S, K, T, r, sigma))
+        drift = (r - 0.5 * sigma**2) * T
+        diffusion = sigma * np.sqrt(T)
+
+        # Options per slice so each temporary holds at most chunk_size prices
+        options_per_slice = max(1, self.chunk_size // self.path_block)
+
+        rng = np.random.default_rng(self.seed)
+        payoff_sum = np.zeros(S.shape)
+        for start in range(0, self.n_paths, self.path_block):
+            half = rng.standard_normal(min(self.path_block, self.n_paths - start) // 2)
+            shocks = np.concatenate([half, -half])
+            for first in range(0, S.size, options_per_slice):
+                rows = slice(first, first + options_per_slice)
+                terminal = S[rows, None] * np.exp(drift[rows, None] + diffusion[rows, None] * shocks)
+                if self.option_type == "call":
+                    payoff = np.maximum(terminal - K[rows, None], 0.0)
+                else:
+                    payoff = np.maximum(K[rows, None] - terminal, 0.0)
+                payoff_sum[rows] += payoff.sum(axis=-1)
+
+        return (np.exp(-r * T) * payoff_sum / self.n_paths).reshape(shape)
+
+class BumpGreeks:
+    def __init__(self, pricer, spot_bump=0.01, vol_bump=0.01, time_bump=1 / 365, rate_bump=0.0001):
+        """
+        Initialize a finite-difference Greek engine for any batch pricer.
+
+        All bumped scenarios are stacked along a leading axis and priced with a
+        single call to pricer.price, so stochastic pricers that reuse their
+        random numbers across the batch get common random numbers for free.
+
+        Parameters:
+        pricer    : Object with a price(S, K, T, r, sigma) method accepting arrays
+        spot_bump : Relative spot bump (fraction of S0)
+        vol_bump  : Absolute volatility bump
+        time_bump : Time bump in years (theta is a one-sided T - h difference)
+        rate_bump : Absolute interest rate bump
+        """
+        self.pricer = pricer
+        self.spot_bump = spot_bump
+        self.vol_bump = vol_bump
+        self.time_bump = time_bump
+        self.rate_bump = rate_bump
+
+    def calculate_greeks(self, S0, K, T, r, sigma):
+        """
+        Calculate first- and second-order Greeks by central differences.
+
+        Inputs may be scalars or arrays of options that broadcast together.
+
+        Returns:
+        A dict with price, delta, gamma, vega, theta, rho, vanna and volga
+        """
+        S0, K, T, r, sigma = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (S0, K, T, r, sigma)))
+        if np.any(T <= self.time_bump):
+            raise ValueError("Time to maturity must be larger than the time bump.")
+        if np.any(sigma <= self.vol_bump):
+            raise ValueError("Volatility must be larger than the volatility bump.")
+        if np.any(S0 <= 0) or self.spot_bump >= 1:
+            raise ValueError("Spot price must be positive and the relative spot bump below 1.")
+
+        dS = self.spot_bump * S0
+        dv = self.vol_bump
+        dT = self.time_bump
+        dr = self.rate_bump
+
+        # (spot, volatility, time, rate) shifts for each scenario, in units of the bump sizes
+        scenarios = np.array([
+            (0, 0, 0, 0),
+            (1, 0, 0, 0), (-1, 0, 0, 0),
+            (0, 1, 0, 0), (0, -1, 0, 0),
+            (0, 0, -1, 0),
+            (0, 0, 0, 1), (0, 0, 0, -1),
+            (1, 1, 0, 0), (1, -1, 0, 0), (-1, 1, 0, 0), (-1, -1, 0, 0),
+        ], dtype=float)
+        expand = (slice(None),) + (None,) * S0.ndim
+        spot_shift, vol_shift, time_shift, rate_shift = (scenarios[:, i][expand] for i in range(4))
+
+        prices = self.pricer.price(
+            S0 + spot_shift * dS,
+            K,
+            T + time_shift * dT,
+            r + rate_shift * dr,
+            sigma + vol_shift * dv,
+        )
+        (base, s_up, s_down, v_up, v_down, t_down, r_up, r_down,
+         up_up, up_down, down_up, down_down) = prices
+
+        return {
+            "price": base,
+            "delta": (s_up - s_down) / (2 * dS),
+            "gamma": (s_up - 2 * base + s_down) / dS**2,
+            "vega": (v_up - v_down) / (2 * dv),
+            "theta": (t_down - base) / dT,
+            "rho": (r_up - r_down) / (2 * dr),
+            "vanna": (up_up - up_down - down_up + down_down) / (4 * dS * dv),
+            "volga": (v_up - 2 * base + v_down) / dv**2,
+        }
+
+def black_scholes_greeks(S0, K, T, r, sigma, option_type="call"):
+    """
+    Analytic Black-Scholes Greeks, used as the reference for BumpGreeks.
+
+    Theta is the derivative with respect to calendar time (per year), matching
+    OptionGreeksVisualization.
+    """
+    option = BlackScholes(S0, K, T, r, sigma)
+    d1 = option._calculate_d1()
+    d2 = option._calculate_d2(d1)
+    sqrt_T = np.sqrt(T)
+    discount = np.exp(-r * T)
+
+    gamma = norm.pdf(d1) / (S0 * sigma * sqrt_T)
+    vega = S0 * norm.pdf(d1) * sqrt_T
+    vanna = -norm.pdf(d1) * d2 / sigma
+    volga = vega * d1 * d2 / sigma
+    decay = -S0 * norm.pdf(d1) * sigma / (2 * sqrt_T)
+
+    if option_type == "call":
+        price = option.calculate_call_price()
+        delta = option.calculate_call_delta()
+        theta = decay - r * K * discount * norm.cdf(d2)
+        rho = K * T * discount * norm.cdf(d2)
+    else:
+        price = option.calculate_put_price()
+        delta = option.calculate_put_delta()
+        theta = decay + r * K * discount * norm.cdf(-d2)
+        rho = -K * T * discount * norm.cdf(-d2)
+
+    return {
+        "price": price,
+        "delta": delta,
+        "gamma": gamma,
+        "vega": vega,
+        "theta": theta,
+        "rho": rho,
+        "vanna": vanna,
+        "volga": volga,
+    }
+
+# Example of usage
+if __name__ == "__main__":
+    S0, K, T, r, sigma = 100, 100, 1, 0.05, 0.2
+
+    for option_type in ("call", "put"):
+        analytic = black_scholes_greeks(S0, K, T, r, sigma, option_type)
+        closed_form = BumpGreeks(BlackScholesPricer(option_type)).calculate_greeks(S0, K, T, r, sigma)
+        monte_carlo = BumpGreeks(MonteCarloPricer(option_type, n_paths=200000)).calculate_greeks(S0, K, T, r, sigma)
+
+        print(f"{option_type.capitalize()} option")
+        print(f"{'Greek':>8} {'Analytic':>12} {'Bump (BS)':>12} {'Bump (MC)':>12}")
+        for greek in analytic:
+            print(f"{greek:>8} {analytic[greek]:12.5f} {closed_form[greek]:12.5f} {monte_carlo[greek]:12.5f}")
+        print()
@@ -0,0 +1,141 @@
+import numpy as np
+from model.black_scholes import BlackScholes
+
+class DeltaHedgingSimulator:
+    def __init__(self, S0, K, T, r, sigma, realized_sigma=None, mu=None, option_type="call",
+                 n_steps=252, rebalance_every=1, chunk_size=2000, seed=None):
+        """
+        Initialize the delta-hedging simulator for a short European option.
+
+        The option is sold at its Black-Scholes price (using sigma) and hedged
+        with the Black-Scholes delta, while the underlying follows a GBM with
+        drift mu and volatility realized_sigma.
+
+        Parameters:
+        S0              : Current stock price (spot price)
+        K               : Strike price
+        T               : Time to maturity (in years)
+        r               : Risk-free interest rate (annual)
+        sigma           : Implied volatility used for pricing and hedging (annual)
+        realized_sigma  : Volatility of the simulated paths (defaults to sigma)
+        mu              : Drift of the simulated paths (defaults to r)
+        option_type     : "call" or "put"
+        n_steps         : Number of simulation time steps until maturity
+        rebalance_every : Number of time steps between hedge rebalances
+        chunk_size      : Number of paths simulated per array batch
+        seed            : Seed for the random number generator
+        """
+        if T <= 0 or sigma <= 0:
+            raise ValueError("Time to maturity and volatility must be positive.")
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'.")
+        if n_steps < 1 or rebalance_every < 1 or chunk_size < 1:
+            raise ValueError("n_steps, rebalance_every and chunk_size must be at least 1.")
+
+        self.S0 = S0
+        self.K = K
+        self.T = T
+        self.r = r
+        self.sigma = sigma
+        self.realized_sigma = sigma if realized_sigma is None else realized_sigma
+        self.mu = r if mu is None else mu
+        self.option_type = option_type
+        self.n_steps = n_steps
+        self.rebalance_every = rebalance_every
+        self.chunk_size = chunk_size
+        self.rng = np.random.default_rng(seed)
+
+        self.dt = T / n_steps
+        # Step indices at which the hedge is reset (always including inception)
+        self.rebalance_steps = np.arange(0, n_steps, rebalance_every)
+
+        option = BlackScholes(S0, K, T, r, sigma)
+        if option_type == "call":
+            self.premium = option.calculate_call_price()
+        else:
+            self.premium = option.calculate_put_price()
+
+    def _simulate_paths(self, n_paths):
+        """Simulate GBM prices at every step, returning an array of shape (n_paths, n_steps + 1)."""
+        drift = (self.mu - 0.5 * self.realized_sigma**2) * self.dt
+        shocks = self.rng.standard_normal((n_paths, self.n_steps))
+        log_paths = np.empty((n_paths, self.n_steps + 1))
+        log_paths[:, 0] = 0.0
+        np.cumsum(drift + self.realized_sigma * np.sqrt(self.dt) * shocks, axis=1, out=log_paths[:, 1:])
+        return self.S0 * np.exp(log_paths)
+
+    def _hedge_chunk(self, n_paths):
+        """Return the hedging P&L at maturity for one batch of paths."""
+        paths = self._simulate_paths(n_paths)
+
+        # Prices at each rebalance date and at maturity
+        hedge_times = self.rebalance_steps * self.dt
+        hedge_prices = paths[:, self.rebalance_steps]
+        final_prices = paths[:, -1]
+
+        # Deltas for all paths and rebalance dates in one evaluation
+        hedge_model = BlackScholes(hedge_prices, self.K, self.T - hedge_times, self.r, self.sigma)
+        if self.option_type == "call":
+            deltas = hedge_model.calculate_call_delta()
+            payoff = np.maximum(final_prices - self.K, 0.0)
+        else:
+            deltas = hedge_model.calculate_put_delta()
+            payoff = np.maximum(self.K - final_prices, 0.0)
+
+        # A self-financing hedge earns delta times the change in the discounted
+        # stock price over each holding period
+        discounted = np.empty((n_paths, len(self.rebalance_steps) + 1))
+        discounted[:, :-1] = hedge_prices * np.exp(-self.r * hedge_times)
+        discounted[:, -1] = final_prices * np.exp(-self.r * self.T)
+        hedge_gains = np.sum(deltas * np.diff(discounted, axis=1), axis=1)
+
+        discounted_pnl = self.premium + hedge_gains - payoff * np.exp(-self.r * self.T)
+        return discounted_pnl * np.exp(self.r * self.T)
+
+    def simulate(self, n_paths=10000):
+        """
+        Simulate the hedging P&L (at maturity) of a short option hedged with shares.
+
+        Paths are processed in chunks of chunk_size so memory stays bounded
+        regardless of the number of paths.
+
+        Parameters:
+        n_paths : Number of simulated paths
+
+        Returns:
+        A numpy array of length n_paths with the P&L of each path
+        """
+        pnl = np.empty(n_paths)
+        for start in range(0, n_paths, self.chunk_size):
+            stop = min(start + self.chunk_size, n_paths)
+            pnl[start:stop] = self._hedge_chunk(stop - start)
+        return pnl
+
+    @staticmethod
+    def summarize(pnl):
+        """Return summary statistics of a hedging P&L distribution."""
+        return {
+            "mean": np.mean(pnl),
+            "std": np.std(pnl),
+            "p5": np.percentile(pnl, 5),
+            "median": np.median(pnl),
+            "p95": np.percentile(pnl, 95),
+            "min": np.min(pnl),
+            "max": np.max(pnl),
+        }
+
+# Example of usage
+if __name__ == "__main__":
+    import time
+
+    # Hedge daily for one year, with realized volatility above implied
+    simulator = DeltaHedgingSimulator(S0=100, K=100, T=1, r=0.05, sigma=0.2,
+                                      realized_sigma=0.25, n_steps=252, seed=42)
+
+    start = time.perf_counter()
+    pnl = simulator.simulate(n_paths=10000)
+    elapsed = time.perf_counter() - start
+
+    print(f"Simulated {len(pnl)} paths x {simulator.n_steps} steps in {elapsed:.2f}s")
+    for name, value in DeltaHedgingSimulator.summarize(pnl).items():
+        print(f"{name:>6}: {value:8.4f}")
@@ -0,0 +1,330 @@
+import time
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr
+
+GREEKS = ["pv", "delta", "gamma", "vega", "theta"]
+
+def _read_table(path):
+    """Read a CSV or Parquet file into a DataFrame."""
+    if str(path).endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+def load_chain(path):
+    """
+    Load an option chain from a CSV or Parquet file.
+
+    Required columns: underlying, strike, maturity (years), volatility, option_type
+    ("call" or "put"). An optional quantity column defaults to 1.
+    """
+    chain = _read_table(path)
+    if "quantity" not in chain:
+        chain["quantity"] = 1.0
+    return chain
+
+def read_ticks(path):
+    """
+    Read (underlying, spot, vol_shift) ticks from a CSV or Parquet file.
+
+    Required columns: underlying, spot. An optional vol_shift column holds
+    volatility quote updates (see StreamingRepricer.on_tick); missing values
+    leave the volatilities unchanged.
+
+    Returns:
+    A generator over the ticks (the file is read and checked up front)
+    """
+    ticks = _read_table(path)
+    missing = {"underlying", "spot"} - set(ticks.columns)
+    if missing:
+        raise ValueError(f"Tick file is missing columns: {sorted(missing)}")
+    if "vol_shift" in ticks:
+        shifts = [None if pd.isna(shift) else float(shift) for shift in ticks["vol_shift"]]
+    else:
+        shifts = [None] * len(ticks)
+    return ((underlying, float(spot), shift) for underlying, spot, shift in zip(ticks["underlying"], ticks["spot"], shifts))
+
+def generate_ticks(spots, n_ticks, volatility=0.2, tick_interval=1 / (252 * 23400), seed=None):
+    """
+    Yield synthetic (underlying, spot, vol_shift) spot ticks following independent GBM moves.
+
+    Parameters:
+    spots         : Dict mapping each underlying to its starting spot price
+    n_ticks       : Total number of ticks to generate
+    volatility    : Annual volatility of the spot moves
+    tick_interval : Time between ticks of one underlying (years, default one second)
+    seed          : Seed for the random number generator
+    """
+    rng = np.random.default_rng(seed)
+    names = list(spots)
+    prices = np.array([spots[name] for name in names], dtype=float)
+    choices = rng.integers(0, len(names), n_ticks)
+    shocks = rng.standard_normal(n_ticks) * volatility * np.sqrt(tick_interval)
+    for i, shock in zip(choices, shocks):
+        prices[i] *= np.exp(shock - 0.5 * volatility**2 * tick_interval)
+        yield names[i], prices[i], None
+
+def _position_greeks(spot, discounted_strike, sqrt_T, sigma, r, is_put, out):
+    """
+    Black-Scholes PV, delta, gamma, vega and theta for contracts on one underlying.
+
+    A lean version of black_scholes_greeks for the per-tick path: d1 and the
+    normal pdf are computed once, scipy.special.ndtr replaces norm.cdf, and
+    puts are handled by put-call parity (is_put is 1.0 for puts, 0.0 for calls).
+    Results are written into the columns of out.
+    """
+    v = sigma * sqrt_T
+    d1 = np.log(spot / discounted_strike) / v + 0.5 * v
+    pdf = np.exp(-0.5 * d1**2) / np.sqrt(2 * np.pi)
+    n_d1 = ndtr(d1)
+    n_d2 = ndtr(d1 - v)
+    decay = spot * pdf * sigma / (2 * sqrt_T)
+
+    out[:, 0] = spot * n_d1 - discounted_strike * n_d2 - is_put * (spot - discounted_strike)
+    out[:, 1] = n_d1 - is_put
+    out[:, 2] = pdf / (spot * v)
+    out[:, 3] = spot * pdf * sqrt_T
+    out[:, 4] = r * discounted_strike * (is_put - n_d2) - decay
+
+class ConflatingQueue:
+    def __init__(self, max_pending):
+        """
+        Bounded buffer holding at most one pending tick per underlying.
+
+        A tick for an underlying that is already pending replaces the older
+        tick (conflation), since only the latest spot matters for repricing.
+        A pending volatility update is kept unless the new tick carries its
+        own. The arrival time of the oldest conflated tick is kept alongside
+        the freshest, so latency under load is not understated.
+        When max_pending underlyings are waiting, ticks for other underlyings
+        are refused and stay in the source (backpressure).
+
+        Parameters:
+        max_pending : Maximum number of underlyings with a pending tick
+        """
+        self.max_pending = max_pending
+        self.pending = OrderedDict()
+        self.conflated = 0
+
+    def __len__(self):
+        return len(self.pending)
+
+    def put(self, underlying, spot, vol_shift, arrival):
+        """Add a tick, conflating it with any pending tick for the same underlying. Returns False if full."""
+        if underlying in self.pending:
+            _, pending_shift, first_arrival, _ = self.pending[underlying]
+            if vol_shift is None:
+                vol_shift = pending_shift
+            self.pending[underlying] = (spot, vol_shift, first_arrival, arrival)
+            self.conflated += 1
+            return True
+        if len(self.pending) >= self.max_pending:
+            return False
+        self.pending[underlying] = (spot, vol_shift, arrival, arrival)
+        return True
+
+    def get(self):
+        """Return the oldest pending (underlying, spot, vol_shift, first_arrival, last_arrival), or None if empty."""
+        if not self.pending:
+            return None
+        underlying, tick = self.pending.popitem(last=False)
+        return (underlying,) + tick
+
+class StreamingRepricer:
+    def __init__(self, chain, r, max_pending=64):
+        """
+        Initialize a streaming repricer for an option chain.
+
+        On every tick, only the contracts on the ticking underlying are
+        repriced, and the position PV and Greeks of that underlying are
+        replaced in the book totals. Ticks can also move the implied
+        volatilities of an underlying's contracts (vol_shift). Maturities are
+        measured from the time the chain was loaded. The chain is sorted by
+        underlying so each underlying's contracts are one contiguous slice.
+
+        Parameters:
+        chain       : DataFrame with underlying, strike, maturity, volatility, option_type and quantity columns
+        r           : Risk-free interest rate (annual)
+        max_pending : Maximum number of underlyings with a pending tick before the feed is held back
+        """
+        self.chain = chain.sort_values("underlying", kind="stable").reset_index(drop=True)
+        self.r = r
+        self.max_pending = max_pending
+
+        self.K = self.chain["strike"].to_numpy(dtype=float)
+        self.T = self.chain["maturity"].to_numpy(dtype=float)
+        self.sigma = self.chain["volatility"].to_numpy(dtype=float)
+        self.quantity = self.chain["quantity"].to_numpy(dtype=float)
+        self.is_put = (self.chain["option_type"] == "put").to_numpy(dtype=float)
+        self.discounted_strike = self.K * np.exp(-r * self.T)
+        self.sqrt_T = np.sqrt(self.T)
+
+        # Contract slice for each underlying, so a tick touches only its own rows
+        self.contracts = {}
+        for name, rows in self.chain.groupby("underlying", sort=False).indices.items():
+            self.contracts[name] = slice(rows[0], rows[-1] + 1)
+        self.underlyings = {name: i for i, name in enumerate(self.contracts)}
+        self.spots = np.full(len(self.underlyings), np.nan)
+        self.vol_shifts = np.zeros(len(self.underlyings))
+
+        # Per-contract values (per unit) and position totals per underlying
+        self.values = np.full((len(self.chain), len(GREEKS)), np.nan)
+        self.totals = np.zeros((len(self.underlyings), len(GREEKS)))
+
+    def on_tick(self, underlying, spot, vol_shift=None):
+        """
+        Reprice the contracts on one underlying and update its book totals.
+
+        Parameters:
+        underlying : Name of the underlying that ticked
+        spot       : New spot price
+        vol_shift  : Parallel shift of the underlying's implied volatilities relative
+                     to the loaded chain (None keeps the last shift)
+        """
+        rows = self.contracts.get(underlying)
+        if rows is None:
+            return False
+        index = self.underlyings[underlying]
+        if vol_shift is not None:
+            self.vol_shifts[index] = vol_shift
+        # Keep shifted volatilities positive
+        sigma = np.maximum(self.sigma[rows] + self.vol_shifts[index], 1e-4)
+
+        values = self.values[rows]
+        _position_greeks(spot, self.discounted_strike[rows], self.sqrt_T[rows], sigma, self.r, self.is_put[rows], values)
+
+        self.spots[index] = spot
+        self.totals[index] = self.quantity[rows] @ values
+        return True
+
+    def book(self):
+        """Return the position PV and Greeks of the whole book."""
+        return dict(zip(GREEKS, self.totals.sum(axis=0)))
+
+    def run(self, ticks, rate=None):
+        """
+        Replay ticks through the repricer and collect latency metrics.
+
+        Replay and repricing share one thread, so the latencies contain no
+        thread hand-off (GIL) delays. With a rate, tick i arrives at
+        start + i / rate: before each repricing, every tick that has arrived
+        is moved into a ConflatingQueue, stamped with its scheduled arrival
+        time, so time spent waiting behind slower repricings is counted.
+        Without a rate, one tick is read per repricing and stamped when read,
+        which measures the maximum throughput with no queueing. Latency is
+        measured until repricing finishes, both from the oldest tick that was
+        conflated into the update and from the freshest one.
+
+        Parameters:
+        ticks : Iterable of (underlying, spot, vol_shift) ticks, e.g. from read_ticks or generate_ticks
+        rate  : Ticks per second to replay at (None replays as fast as possible)
+
+        Returns:
+        A dict with tick counts, throughput and latency statistics (in microseconds)
+        """
+        queue = ConflatingQueue(self.max_pending)
+        source = iter(ticks)
+        next_tick = next(source, None)
+        received = 0
+        oldest, freshest = [], []
+
+        start = time.perf_counter_ns()
+        while next_tick is not None or len(queue):
+            # Move every tick that has arrived into the queue, unless it pushes back
+            now = time.perf_counter_ns()
+            while next_tick is not None:
+                arrival = now if rate is None else start + int(received * 1e9 / rate)
+                if arrival > now or not queue.put(*next_tick, arrival):
+                    break
+                received += 1
+                next_tick = next(source, None)
+                if rate is None:
+                    break
+
+            tick = queue.get()
+            if tick is None:
+                # Idle until the next tick is due; spin for the last half millisecond
+                delay = (arrival - time.perf_counter_ns()) / 1e9
+                if delay > 5e-4:
+                    time.sleep(delay - 5e-4)
+                continue
+
+            underlying, spot, vol_shift, first_arrival, last_arrival = tick
+            if self.on_tick(underlying, spot, vol_shift):
+                done = time.perf_counter_ns()
+                oldest.append(done - first_arrival)
+                freshest.append(done - last_arrival)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+
+        return self._report(np.array(oldest) / 1e3, np.array(freshest) / 1e3, received, queue.conflated, elapsed)
+
+    @staticmethod
+    def _latency_stats(latencies):
+        """Percentiles of latencies in microseconds."""
+        if not len(latencies):
+            return {}
+        return {
+            "p50_us": np.percentile(latencies, 50),
+            "p90_us": np.percentile(latencies, 90),
+            "p99_us": np.percentile(latencies, 99),
+            "max_us": np.max(latencies),
+        }
+
+    @staticmethod
+    def _report(oldest, freshest, received, conflated, elapsed):
+        """Summarize per-tick latencies (microseconds) and throughput."""
+        edges = np.logspace(0, 6, 25)  # 1 microsecond to 1 second
+        counts, _ = np.histogram(oldest, bins=edges)
+        return {
+            "received": received,
+            "processed": len(oldest),
+            "conflated": conflated,
+            "elapsed_s": elapsed,
+            "throughput_tps": len(oldest) / elapsed if elapsed > 0 else np.nan,
+            "oldest": StreamingRepricer._latency_stats(oldest),
+            "freshest": StreamingRepricer._latency_stats(freshest),
+            "histogram": (counts, edges),
+        }
+
+def print_report(report):
+    """Print a latency and throughput report produced by StreamingRepricer.run."""
+    print(f"Ticks received: {report['received']}, processed: {report['processed']}, conflated: {report['conflated']}")
+    print(f"Throughput: {report['throughput_tps']:.0f} ticks/s over {report['elapsed_s']:.2f}s")
+    for name in ("oldest", "freshest"):
+        stats = report[name]
+        if stats:
+            print(f"Latency from {name} tick (us): p50 {stats['p50_us']:.1f}, p90 {stats['p90_us']:.1f}, "
+                  f"p99 {stats['p99_us']:.1f}, max {stats['max_us']:.1f}")
+    print("Histogram of latency from oldest tick (us):")
+    counts, edges = report["histogram"]
+    peak = max(counts.max(), 1)
+    for count, low, high in zip(counts, edges[:-1], edges[1:]):
+        if count:
+            print(f"{low:>10.1f} - {high:<10.1f} {'#' * int(40 * count / peak)} {count}")
+
+# Example of usage
+if __name__ == "__main__":
+    # Build a chain of 10 underlyings with 200 contracts each
+    rng = np.random.default_rng(0)
+    spots = {f"STK{i}": 100.0 for i in range(10)}
+    rows = []
+    for name, spot in spots.items():
+        for strike in np.linspace(0.7 * spot, 1.3 * spot, 20):
+            for maturity in np.linspace(0.1, 2.0, 5):
+                for option_type in ("call", "put"):
+                    rows.append((name, strike, maturity, rng.uniform(0.15, 0.35), option_type, rng.integers(-10, 11)))
+    chain = pd.DataFrame(rows, columns=["underlying", "strike", "maturity", "volatility", "option_type", "quantity"])
+
+    repricer = StreamingRepricer(chain, r=0.05)
+
+    print("Paced replay (2,000 ticks/s):")
+    print_report(repricer.run(generate_ticks(spots, 4000, seed=1), rate=2000))
+    print()
+    print("Paced replay above capacity (20,000 ticks/s, conflation under load):")
+    print_report(repricer.run(generate_ticks(spots, 20000, seed=2), rate=20000))
+    print()
+    print("Unpaced replay (maximum throughput):")
+    print_report(repricer.run(generate_ticks(spots, 20000, seed=3)))
+    print()
+    print("Book:", {name: round(value, 2) for name, value in repricer.book().items()})
@@ -3,6 +3,7 @@ from .option_pl import OptionPLVisualization as PLVisualizations
 from .volatility_impact import VolatilityImpactVisualization as VolatilityVisualizations
 from .time_vs_price import TimeVsPriceVisualization as TimeVsPriceVisualizations
 from .heatmap import HeatmapVisualization
+from .hedging_pnl import HedgingPnLVisualization as HedgingVisualizations
 
 # You can add utility functions or classes from common.py if needed
 from .common import get_default_layout, add_trace, get_color_scale
@@ -0,0 +1,58 @@
+# src/visualizations/hedging_pnl.py
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from model.delta_hedging import DeltaHedgingSimulator
+
+@st.cache_data
+def simulate_hedging_pnl(S0, K, T, r, sigma, realized_sigma, n_paths, n_steps, rebalance_every, option_type, seed):
+    """Run the hedging simulation, cached on its inputs so unrelated Streamlit reruns reuse the result."""
+    simulator = DeltaHedgingSimulator(
+        S0=S0, K=K, T=T, r=r, sigma=sigma,
+        realized_sigma=realized_sigma, option_type=option_type,
+        n_steps=n_steps, rebalance_every=rebalance_every,
+        seed=seed  # Fixed seed so reruns redraw the same paths
+    )
+    return simulator.simulate(n_paths=n_paths)
+
+class HedgingPnLVisualization:
+    def __init__(self, option):
+        """
+        Initializes the HedgingPnLVisualization class with an option object.
+
+        Parameters:
+        option : A BlackScholes object containing option data
+        """
+        self.option = option
+
+    def plot_hedging_pnl(self, realized_sigma=None, n_paths=10000, n_steps=252, rebalance_every=1, option_type="call", seed=0):
+        """Plot the distribution of delta-hedged P&L for a short option"""
+        try:
+            pnl = simulate_hedging_pnl(
+                self.option.S0, self.option.K, self.option.T, self.option.r, self.option.sigma,
+                realized_sigma, n_paths, n_steps, rebalance_every, option_type, seed
+            )
+        except ValueError as e:
+            st.warning(f"Cannot run the hedging simulation: {e}")
+            return
+
+        stats = DeltaHedgingSimulator.summarize(pnl)
+
+        # Histogram of the hedged P&L across paths
+        fig = go.Figure()
+        fig.add_trace(go.Histogram(x=pnl, nbinsx=100, name='Hedged P&L', marker=dict(color='royalblue')))
+        fig.add_vline(x=stats["mean"], line=dict(color='orange', dash='dash'))
+
+        fig.update_layout(
+            title=f"Delta-Hedged P&L Distribution (Short {option_type.capitalize()}, {n_paths} paths)",
+            xaxis_title="Hedging P&L at Maturity ($)",
+            yaxis_title="Number of Paths",
+            template="plotly_dark",
+            hovermode="closest",
+            dragmode="zoom"
+        )
+
+        st.plotly_chart(fig)
+        st.table(pd.DataFrame({"Statistic": list(stats.keys()), "Value": np.round(list(stats.values()), 4)}))